@@ -27,12 +27,17 @@ class LangfuseConnector:
     **Environment Configuration:**
     - `LANGFUSE_SECRET_KEY` and `LANGFUSE_PUBLIC_KEY`: Required Langfuse API credentials.
     - `HAYSTACK_CONTENT_TRACING_ENABLED`: Must be set to `"true"` to enable tracing.
-    - `HAYSTACK_LANGFUSE_ENFORCE_FLUSH`: (Optional) If set to `"false"`, disables flushing after each component.
-      Be cautious: this may cause data loss on crashes unless you manually flush before shutdown.
-      By default, the data is flushed after each component and blocks the thread until the data is sent to Langfuse.
+    - `HAYSTACK_LANGFUSE_ENFORCE_FLUSH`: (Optional) If set to `"true"`, schedules a flush after each component.
+      The flushes are executed in batches by a background thread, so the pipeline does not block until the data is
+      sent to Langfuse. Use `flush_at` and `flush_interval` to tune the batching. By default, no flush is enforced and
+      the Langfuse client sends the data in the background on its own. Be cautious: this may cause data loss on
+      crashes unless you manually flush before shutdown.
 
-    If you disable flushing after each component make sure you will call langfuse.flush() explicitly before the
-    program exits. For example:
+    Neither setting guarantees that the data is sent by the time the pipeline run returns. If you need that guarantee,
+    for example in serverless environments, call `tracer.actual_tracer.flush()` after the run.
+
+    If you don't enforce flushing after each component make sure you will call langfuse.flush() explicitly before
+    the program exits. For example:
 
     ```python
     from haystack.tracing import tracer
@@ -125,6 +130,8 @@ class LangfuseConnector:
         *,
         host: Optional[str] = None,
         langfuse_client_kwargs: Optional[Dict[str, Any]] = None,
+        flush_at: int = 50,
+        flush_interval: float = 1.0,
     ) -> None:
         """
         Initialize the LangfuseConnector component.
@@ -148,6 +155,10 @@ class LangfuseConnector:
         :param langfuse_client_kwargs: Optional custom configuration for the Langfuse client. This is a dictionary
             containing any additional configuration options for the Langfuse client. See the Langfuse documentation
             for more details on available configuration options.
+        :param flush_at: Number of finished spans after which the Langfuse client is flushed in the background.
+            Only used when `HAYSTACK_LANGFUSE_ENFORCE_FLUSH` is set to `"true"`.
+        :param flush_interval: Maximum number of seconds a finished span waits before the Langfuse client is flushed
+            in the background. Only used when `HAYSTACK_LANGFUSE_ENFORCE_FLUSH` is set to `"true"`.
         """
         self.name = name
         self.public = public
@@ -156,6 +167,8 @@ class LangfuseConnector:
         self.span_handler = span_handler
         self.host = host
         self.langfuse_client_kwargs = langfuse_client_kwargs
+        self.flush_at = flush_at
+        self.flush_interval = flush_interval
         resolved_langfuse_client_kwargs = {
             "secret_key": secret_key.resolve_value() if secret_key else None,
             "public_key": public_key.resolve_value() if public_key else None,
@@ -168,6 +181,8 @@ class LangfuseConnector:
             name=name,
             public=public,
             span_handler=span_handler,
+            flush_at=flush_at,
+            flush_interval=flush_interval,
         )
         tracing.enable_tracing(self.tracer)
 
@@ -215,6 +230,8 @@ class LangfuseConnector:
             span_handler=span_handler,
             host=self.host,
             langfuse_client_kwargs=langfuse_client_kwargs,
+            flush_at=self.flush_at,
+            flush_interval=self.flush_interval,
         )
 
     @classmethod
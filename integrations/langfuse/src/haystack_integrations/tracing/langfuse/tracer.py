@@ -3,13 +3,18 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import contextlib
+import functools
 import os
+import queue
+import re
+import threading
+import time
 from abc import ABC, abstractmethod
 from collections import Counter
 from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Iterator, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from haystack import default_from_dict, default_to_dict, logging
 from haystack.dataclasses import ChatMessage
@@ -18,37 +23,68 @@ from haystack.tracing import tracer as proxy_tracer
 from haystack.tracing import utils as tracing_utils
 from typing_extensions import TypeAlias
 
-import langfuse
-from langfuse.client import StatefulGenerationClient, StatefulSpanClient, StatefulTraceClient
+if TYPE_CHECKING:
+    # langfuse is imported lazily at runtime as importing it is slow, see _langfuse_endable_span_types
+    import langfuse
+    from langfuse.client import StatefulGenerationClient, StatefulSpanClient, StatefulTraceClient
 
-# Type alias for Langfuse stateful clients
-LangfuseStatefulClient: TypeAlias = Union[StatefulTraceClient, StatefulSpanClient, StatefulGenerationClient]
+    # Type alias for Langfuse stateful clients
+    LangfuseStatefulClient: TypeAlias = Union[StatefulTraceClient, StatefulSpanClient, StatefulGenerationClient]
+
+
+def __getattr__(name: str) -> Any:
+    # Keep LangfuseStatefulClient importable at runtime without importing langfuse together with this module
+    if name == "LangfuseStatefulClient":
+        from langfuse.client import (  # noqa: PLC0415
+            StatefulGenerationClient,
+            StatefulSpanClient,
+            StatefulTraceClient,
+        )
+
+        return Union[StatefulTraceClient, StatefulSpanClient, StatefulGenerationClient]
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+@functools.lru_cache(maxsize=None)
+def _langfuse_endable_span_types() -> Tuple[type, ...]:
+    """
+    Return the Langfuse clients of spans that need to be ended explicitly, importing langfuse on first use.
+    """
+    from langfuse.client import StatefulGenerationClient, StatefulSpanClient  # noqa: PLC0415
+
+    return (StatefulSpanClient, StatefulGenerationClient)
 
 
 logger = logging.getLogger(__name__)
 
 HAYSTACK_LANGFUSE_ENFORCE_FLUSH_ENV_VAR = "HAYSTACK_LANGFUSE_ENFORCE_FLUSH"
-_SUPPORTED_GENERATORS = [
-    "AzureOpenAIGenerator",
-    "OpenAIGenerator",
-    "AnthropicGenerator",
-    "HuggingFaceAPIGenerator",
-    "HuggingFaceLocalGenerator",
-    "CohereGenerator",
-    "OllamaGenerator",
-]
-_SUPPORTED_CHAT_GENERATORS = [
-    "AmazonBedrockChatGenerator",
-    "AzureOpenAIChatGenerator",
-    "OpenAIChatGenerator",
-    "AnthropicChatGenerator",
-    "HuggingFaceAPIChatGenerator",
-    "HuggingFaceLocalChatGenerator",
-    "CohereChatGenerator",
-    "OllamaChatGenerator",
-    "GoogleGenAIChatGenerator",
-]
-_ALL_SUPPORTED_GENERATORS = _SUPPORTED_GENERATORS + _SUPPORTED_CHAT_GENERATORS
+# Sets, as the component type of every span is looked up in them
+_SUPPORTED_GENERATORS = frozenset(
+    {
+        "AzureOpenAIGenerator",
+        "OpenAIGenerator",
+        "AnthropicGenerator",
+        "HuggingFaceAPIGenerator",
+        "HuggingFaceLocalGenerator",
+        "CohereGenerator",
+        "OllamaGenerator",
+    }
+)
+_SUPPORTED_CHAT_GENERATORS = frozenset(
+    {
+        "AmazonBedrockChatGenerator",
+        "AzureOpenAIChatGenerator",
+        "OpenAIChatGenerator",
+        "AnthropicChatGenerator",
+        "HuggingFaceAPIChatGenerator",
+        "HuggingFaceLocalChatGenerator",
+        "CohereChatGenerator",
+        "OllamaChatGenerator",
+        "GoogleGenAIChatGenerator",
+    }
+)
+_ALL_SUPPORTED_GENERATORS = _SUPPORTED_GENERATORS | _SUPPORTED_CHAT_GENERATORS
 
 # These are the keys used by Haystack for traces and span.
 # We keep them here to avoid making typos when using them.
@@ -61,17 +97,33 @@ _COMPONENT_TYPE_KEY = "haystack.component.type"
 _COMPONENT_OUTPUT_KEY = "haystack.component.output"
 _COMPONENT_INPUT_KEY = "haystack.component.input"
 
+# Matches the ISO 8601 forms accepted by datetime.fromisoformat on Python 3.11+, e.g. "2021-07-27T16:02:08.012345",
+# "2021-07-27T16" or "20210727T160208". Used to reject malformed completion_start_time values without raising and
+# catching an exception, fromisoformat still decides whether a matching value is valid.
+_ISO_DATETIME_RE = re.compile(
+    r"^(?:\d{4}-?\d{2}-?\d{2}|\d{4}-?W\d{2}(?:-?\d)?)"  # calendar or week date
+    r"(?:.\d{2}(?::?\d{2}(?::?\d{2}(?:[.,]\d+)?)?)?"  # any single character separator and time
+    r"(?:Z|[+-]\d{2}(?::?\d{2}(?::?\d{2}(?:[.,]\d+)?)?)?)?)?$"  # UTC offset
+)
+
 # Context var used to keep track of tracing related info.
 # This mainly useful for parents spans.
 tracing_context_var: ContextVar[Dict[Any, Any]] = ContextVar("tracing_context")
 
+# Context var holding the stack of active spans as (tracer, span) pairs, innermost last.
+# Being a context var, each thread and asyncio task has its own stack so concurrent pipeline runs don't share parents.
+# Spans are paired with their tracer so that separate tracers don't share parents either.
+_span_stack_var: ContextVar[Tuple[Tuple["LangfuseTracer", "LangfuseSpan"], ...]] = ContextVar(
+    "langfuse_span_stack", default=()
+)
+
 
 class LangfuseSpan(Span):
     """
     Internal class representing a bridge between the Haystack span tracing API and Langfuse.
     """
 
-    def __init__(self, span: LangfuseStatefulClient) -> None:
+    def __init__(self, span: "LangfuseStatefulClient") -> None:
         """
         Initialize a LangfuseSpan instance.
 
@@ -121,7 +173,7 @@ class LangfuseSpan(Span):
 
         self._data[key] = value
 
-    def raw_span(self) -> LangfuseStatefulClient:
+    def raw_span(self) -> "LangfuseStatefulClient":
         """
         Return the underlying span instance.
 
@@ -204,7 +256,7 @@ class SpanHandler(ABC):
     def __init__(self) -> None:
         self.tracer: Optional[langfuse.Langfuse] = None
 
-    def init_tracer(self, tracer: langfuse.Langfuse) -> None:
+    def init_tracer(self, tracer: "langfuse.Langfuse") -> None:
         """
         Initialize with Langfuse tracer. Called internally by LangfuseTracer.
 
@@ -318,11 +370,7 @@ class DefaultSpanHandler(SpanHandler):
                 meta = replies[0].meta
                 completion_start_time = meta.get("completion_start_time")
                 if completion_start_time:
-                    try:
-                        completion_start_time = datetime.fromisoformat(completion_start_time)
-                    except ValueError:
-                        logger.error(f"Failed to parse completion_start_time: {completion_start_time}")
-                        completion_start_time = None
+                    completion_start_time = _parse_completion_start_time(completion_start_time)
                 span.raw_span().update(
                     usage=meta.get("usage") or None,
                     model=meta.get("model"),
@@ -330,6 +378,23 @@ class DefaultSpanHandler(SpanHandler):
                 )
 
 
+def _parse_completion_start_time(value: str) -> Optional[datetime]:
+    """
+    Parse the ISO 8601 completion_start_time reported by chat generators.
+
+    :param value: The timestamp to parse.
+    :returns: The parsed datetime, or None if the timestamp is malformed.
+    """
+    if _ISO_DATETIME_RE.match(value):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            # well-formed but out of range values, e.g. "2021-07-32"
+            pass
+    logger.error(f"Failed to parse completion_start_time: {value}")
+    return None
+
+
 class LangfuseTracer(Tracer):
     """
     Internal class representing a bridge between the Haystack tracer and Langfuse.
@@ -337,10 +402,13 @@ class LangfuseTracer(Tracer):
 
     def __init__(
         self,
-        tracer: langfuse.Langfuse,
+        tracer: "langfuse.Langfuse",
         name: str = "Haystack",
         public: bool = False,
         span_handler: Optional[SpanHandler] = None,
+        *,
+        flush_at: int = 50,
+        flush_interval: float = 1.0,
     ) -> None:
         """
         Initialize a LangfuseTracer instance.
@@ -352,6 +420,11 @@ class LangfuseTracer(Tracer):
             be publicly accessible to anyone with the tracing URL. If set to `False`, the tracing data will be private
             and only accessible to the Langfuse account owner.
         :param span_handler: Custom handler for processing spans. If None, uses DefaultSpanHandler.
+        :param flush_at: Number of finished spans after which the Langfuse client is flushed in the background.
+            Only used when flushing is enforced via the `HAYSTACK_LANGFUSE_ENFORCE_FLUSH` environment variable.
+        :param flush_interval: Maximum number of seconds a finished span waits before the Langfuse client is flushed
+            in the background. Only used when flushing is enforced via the `HAYSTACK_LANGFUSE_ENFORCE_FLUSH`
+            environment variable.
         """
         if not proxy_tracer.is_content_tracing_enabled:
             logger.warning(
@@ -360,12 +433,17 @@ class LangfuseTracer(Tracer):
                 "before importing Haystack."
             )
         self._tracer = tracer
-        self._context: List[LangfuseSpan] = []
         self._name = name
         self._public = public
-        self.enforce_flush = os.getenv(HAYSTACK_LANGFUSE_ENFORCE_FLUSH_ENV_VAR, "true").lower() == "true"
+        self.enforce_flush = os.getenv(HAYSTACK_LANGFUSE_ENFORCE_FLUSH_ENV_VAR, "false").lower() == "true"
         self._span_handler = span_handler or DefaultSpanHandler()
         self._span_handler.init_tracer(tracer)
+        self._flush_at = flush_at
+        self._flush_interval = flush_interval
+        # Finished spans are queued here and flushed in batches by a background thread started on first use
+        self._flush_queue: Optional[queue.Queue[Optional[int]]] = None
+        self._flush_thread: Optional[threading.Thread] = None
+        self._flush_thread_lock = threading.Lock()
 
     @contextlib.contextmanager
     def trace(
@@ -391,7 +469,7 @@ class LangfuseTracer(Tracer):
         # Create span using the handler
         span = self._span_handler.create_span(span_context)
 
-        self._context.append(span)
+        _span_stack_var.set((*_span_stack_var.get(), (self, span)))
         span.set_tags(tags)
 
         try:
@@ -404,7 +482,7 @@ class LangfuseTracer(Tracer):
 
                 # End span (may fail if span data is corrupted)
                 raw_span = span.raw_span()
-                if isinstance(raw_span, (StatefulSpanClient, StatefulGenerationClient)):
+                if isinstance(raw_span, _langfuse_endable_span_types()):
                     raw_span.end()
             except Exception as cleanup_error:
                 # Log cleanup errors but don't let them corrupt context
@@ -416,22 +494,118 @@ class LangfuseTracer(Tracer):
             finally:
                 # CRITICAL: Always pop context to prevent corruption
                 # This is especially important for nested pipeline scenarios
-                if self._context and self._context[-1] == span:
-                    self._context.pop()
+                self._pop_span(span)
 
             if self.enforce_flush:
-                self.flush()
+                self._schedule_flush()
 
     def flush(self) -> None:
         self._tracer.flush()
 
+    def shutdown(self) -> None:
+        """
+        Flush all pending spans and stop the background flush thread.
+
+        The tracer keeps working after shutdown, a new background flush thread is started when needed.
+        """
+        with self._flush_thread_lock:
+            flush_thread, flush_queue = self._flush_thread, self._flush_queue
+            self._flush_thread, self._flush_queue = None, None
+            if flush_queue is not None:
+                flush_queue.put_nowait(None)
+        if flush_thread is not None:
+            flush_thread.join()
+
+    def _schedule_flush(self) -> None:
+        """
+        Queue a flush of the Langfuse client, to be executed by the background flush thread.
+        """
+        with self._flush_thread_lock:
+            # The thread stops when idle, and is gone in processes forked from the one that started it
+            if self._flush_thread is None or not self._flush_thread.is_alive():
+                self._flush_queue = queue.Queue()
+                self._flush_thread = threading.Thread(
+                    target=self._flush_loop, args=(self._flush_queue,), name="langfuse-flush", daemon=True
+                )
+                self._flush_thread.start()
+            self._flush_queue.put_nowait(1)
+
+    def _flush_loop(self, flush_queue: queue.Queue[Optional[int]]) -> None:
+        """
+        Flush the Langfuse client once `flush_at` spans are pending or `flush_interval` seconds have passed.
+
+        Runs until a `None` sentinel is received, see `shutdown`, or until no span was reported for `flush_interval`
+        seconds. Stopping when idle means the thread doesn't keep a tracer that is no longer used alive.
+
+        :param flush_queue: The queue the finished spans are reported to.
+        """
+        pending = 0
+        deadline = 0.0
+        while True:
+            timeout = max(deadline - time.monotonic(), 0.0) if pending else self._flush_interval
+            try:
+                item = flush_queue.get(timeout=timeout)
+            except queue.Empty:
+                if not pending:
+                    with self._flush_thread_lock:
+                        # spans are reported under the lock, so none can be queued after this check
+                        if flush_queue.empty():
+                            if self._flush_queue is flush_queue:
+                                self._flush_thread, self._flush_queue = None, None
+                            return
+                    continue
+                item = 0
+
+            if item is None:
+                if pending:
+                    self._flush_pending()
+                return
+
+            if item and not pending:
+                deadline = time.monotonic() + self._flush_interval
+            pending += item
+            if pending >= self._flush_at or time.monotonic() >= deadline:
+                self._flush_pending()
+                pending = 0
+
+    def _flush_pending(self) -> None:
+        try:
+            self.flush()
+        except Exception as flush_error:
+            # Never let a failed flush kill the background thread
+            logger.warning("Error while flushing Langfuse tracer: {flush_error}", flush_error=flush_error)
+
+    @property
+    def _context(self) -> Tuple[LangfuseSpan, ...]:
+        """
+        Return the stack of active spans of this tracer in the current context, innermost last.
+        """
+        return tuple(span for tracer, span in _span_stack_var.get() if tracer is self)
+
+    def _pop_span(self, span: LangfuseSpan) -> None:
+        """
+        Remove the span from the stack if it's the innermost active span of this tracer.
+
+        :param span: The span to remove.
+        """
+        stack = _span_stack_var.get()
+        for index in range(len(stack) - 1, -1, -1):
+            tracer, active_span = stack[index]
+            if tracer is self:
+                if active_span == span:
+                    _span_stack_var.set(stack[:index] + stack[index + 1 :])
+                return
+
     def current_span(self) -> Optional[Span]:
         """
         Return the current active span.
 
         :return: The current span if available, else None.
         """
-        return self._context[-1] if self._context else None
+        for tracer, span in reversed(_span_stack_var.get()):
+            if tracer is self:
+                return span
+        return None
 
     def get_trace_url(self) -> str:
         """
@@ -69,6 +69,8 @@ class TestLangfuseConnector:
                 "span_handler": None,
                 "host": None,
                 "langfuse_client_kwargs": None,
+                "flush_at": 50,
+                "flush_interval": 1.0,
             },
         }
 
@@ -84,6 +86,8 @@ class TestLangfuseConnector:
             span_handler=CustomSpanHandler(),
             host="https://example.com",
             langfuse_client_kwargs={"timeout": 30.0},
+            flush_at=10,
+            flush_interval=0.5,
         )
 
         serialized = langfuse_connector.to_dict()
@@ -111,6 +115,8 @@ class TestLangfuseConnector:
                 },
                 "host": "https://example.com",
                 "langfuse_client_kwargs": {"timeout": 30.0},
+                "flush_at": 10,
+                "flush_interval": 0.5,
             },
         }
 
@@ -146,6 +152,10 @@ class TestLangfuseConnector:
         assert langfuse_connector.span_handler is None
         assert langfuse_connector.host is None
         assert langfuse_connector.langfuse_client_kwargs is None
+        # missing from pipelines serialized before flush_at and flush_interval were added
+        assert langfuse_connector.flush_at == 50
+        assert langfuse_connector.flush_interval == 1.0
+        assert langfuse_connector.tracer._flush_at == 50
 
     def test_from_dict_with_params(self, monkeypatch):
         monkeypatch.setenv("LANGFUSE_SECRET_KEY", "secret")
@@ -175,6 +185,8 @@ class TestLangfuseConnector:
                 },
                 "host": "https://example.com",
                 "langfuse_client_kwargs": {"timeout": 30.0},
+                "flush_at": 10,
+                "flush_interval": 0.5,
             },
         }
 
@@ -186,6 +198,10 @@ class TestLangfuseConnector:
         assert isinstance(langfuse_connector.span_handler, CustomSpanHandler)
         assert langfuse_connector.host == "https://example.com"
         assert langfuse_connector.langfuse_client_kwargs == {"timeout": 30.0}
+        assert langfuse_connector.flush_at == 10
+        assert langfuse_connector.flush_interval == 0.5
+        assert langfuse_connector.tracer._flush_at == 10
+        assert langfuse_connector.tracer._flush_interval == 0.5
 
     def test_pipeline_serialization(self, monkeypatch):
         # Set test env vars
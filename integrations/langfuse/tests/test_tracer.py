@@ -3,26 +3,48 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import datetime
+import gc
 import json
 import logging
 import sys
+import threading
+import weakref
 from typing import Optional
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 from haystack import Pipeline, component
 from haystack.dataclasses import ChatMessage, ToolCall
+from haystack.tracing import tracer as proxy_tracer
 
 from haystack_integrations.components.connectors.langfuse import LangfuseConnector
 from haystack_integrations.tracing.langfuse.tracer import (
     _COMPONENT_OUTPUT_KEY, DefaultSpanHandler, LangfuseSpan, LangfuseTracer,
-    SpanContext)
+    SpanContext, _parse_completion_start_time, _span_stack_var)
+
+# Replies shared by the generation tests, they are only read
+_MSG_OK = ChatMessage.from_assistant(
+    "", meta={"completion_start_time": "2021-07-27T16:02:08.012345", "model": "test_model"}
+)
+_MSG_BAD = ChatMessage.from_assistant("", meta={"completion_start_time": "foobar", "model": "test_model"})
 
 
 class MockSpan:
+    # Fixed slots for the keys the tracer updates, attributes that are never updated raise AttributeError when read.
+    # Keys without a slot, e.g. ones the tracer starts sending later, are stored in __dict__ instead of failing.
+    __slots__ = (
+        "__dict__",
+        "completion_start_time",
+        "input",
+        "metadata",
+        "model",
+        "name",
+        "operation_name",
+        "output",
+        "usage",
+    )
+
     def __init__(self):
-        self._data = {}
-        self._span = self
         self.operation_name = "operation_name"
 
     def raw_span(self):
@@ -34,7 +56,8 @@ class MockSpan:
         return self
 
     def update(self, **kwargs):
-        self._data.update(kwargs)
+        for key, value in kwargs.items():
+            setattr(self, key, value)
 
     def generation(self, name=None):
         return self
@@ -52,6 +75,14 @@ class MockTracer:
         pass
 
 
+class CountingTracer(MockTracer):
+    def __init__(self):
+        self.flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+
+
 class CustomSpanHandler(DefaultSpanHandler):
     def handle(self, span: LangfuseSpan, component_type: Optional[str]) -> None:
         if component_type == "OpenAIChatGenerator":
@@ -65,7 +96,7 @@ class TestLangfuseSpan:
 
     #  LangfuseSpan can be initialized with a span object
     def test_initialized_with_span_object(self):
-        mock_span = Mock()
+        mock_span = object()
         span = LangfuseSpan(mock_span)
         assert span.raw_span() == mock_span
 
@@ -119,6 +150,18 @@ class TestLangfuseSpan:
         assert span._data["key.output"] == {"replies": ["reply1", "reply2"]}
 
 
+def test_langfuse_stateful_client_alias_is_importable():
+    from langfuse.client import StatefulGenerationClient, StatefulSpanClient, StatefulTraceClient
+
+    from haystack_integrations.tracing.langfuse.tracer import LangfuseStatefulClient
+
+    assert set(LangfuseStatefulClient.__args__) == {
+        StatefulTraceClient,
+        StatefulSpanClient,
+        StatefulGenerationClient,
+    }
+
+
 class TestSpanContext:
     def test_post_init(self):
         with pytest.raises(ValueError):
@@ -204,6 +247,33 @@ class TestDefaultSpanHandler:
         }
 
 
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("2021-07-27T16:02:08.012345", datetime.datetime(2021, 7, 27, 16, 2, 8, 12345)),
+        (
+            "2021-07-27T16:02:08+00:00",
+            datetime.datetime(2021, 7, 27, 16, 2, 8, tzinfo=datetime.timezone.utc),
+        ),
+        pytest.param(
+            "2021-07-27T16",
+            datetime.datetime(2021, 7, 27, 16),
+            marks=pytest.mark.skipif(sys.version_info < (3, 11), reason="needs Python 3.11+ fromisoformat"),
+        ),
+        pytest.param(
+            "20210727T160208",
+            datetime.datetime(2021, 7, 27, 16, 2, 8),
+            marks=pytest.mark.skipif(sys.version_info < (3, 11), reason="needs Python 3.11+ fromisoformat"),
+        ),
+        ("2021-07-32", None),
+        ("2021-07-27T16:02:08 and more", None),
+        ("foobar", None),
+    ],
+)
+def test_parse_completion_start_time(value, expected):
+    assert _parse_completion_start_time(value) == expected
+
+
 class TestCustomSpanHandler:
     def test_handle(self):
         mock_span = Mock()
@@ -232,26 +302,29 @@ class TestCustomSpanHandler:
 
 class TestLangfuseTracer:
     def test_initialization(self):
-        langfuse_instance = Mock()
+        langfuse_instance = object()
         tracer = LangfuseTracer(tracer=langfuse_instance, name="Haystack", public=True)
         assert tracer._tracer == langfuse_instance
-        assert tracer._context == []
+        assert len(tracer._context) == 0
         assert tracer._name == "Haystack"
         assert tracer._public
 
     def test_create_new_span(self):
-        mock_raw_span = MagicMock()
+        mock_raw_span = Mock()
         mock_raw_span.operation_name = "operation_name"
         mock_raw_span.metadata = {"tag1": "value1", "tag2": "value2"}
 
-        with patch("haystack_integrations.tracing.langfuse.tracer.LangfuseSpan") as MockLangfuseSpan:
+        with patch("haystack_integrations.tracing.langfuse.tracer.LangfuseSpan", new_callable=Mock) as MockLangfuseSpan:
             mock_span_instance = MockLangfuseSpan.return_value
             mock_span_instance.raw_span.return_value = mock_raw_span
+            # no span data, coercing auto-created mock attributes to tag values never terminates
+            mock_span_instance.get_data.return_value = {}
 
-            mock_context_manager = MagicMock()
-            mock_context_manager.__enter__.return_value = mock_span_instance
+            mock_context_manager = Mock()
+            mock_context_manager.__enter__ = Mock(return_value=mock_span_instance)
+            mock_context_manager.__exit__ = Mock(return_value=False)
 
-            mock_tracer = MagicMock()
+            mock_tracer = Mock()
             mock_tracer.trace.return_value = mock_context_manager
 
             tracer = LangfuseTracer(tracer=mock_tracer, name="Haystack", public=False)
@@ -270,28 +343,25 @@ class TestLangfuseTracer:
     def test_update_span_with_pipeline_input_output_data(self):
         tracer = LangfuseTracer(tracer=MockTracer(), name="Haystack", public=False)
         with tracer.trace(operation_name="operation_name", tags={"haystack.pipeline.input_data": "hello"}) as span:
-            assert span.raw_span()._data["metadata"] == {"haystack.pipeline.input_data": "hello"}
+            assert span.raw_span().metadata == {"haystack.pipeline.input_data": "hello"}
 
         with tracer.trace(operation_name="operation_name", tags={"haystack.pipeline.output_data": "bye"}) as span:
-            assert span.raw_span()._data["metadata"] == {"haystack.pipeline.output_data": "bye"}
+            assert span.raw_span().metadata == {"haystack.pipeline.output_data": "bye"}
 
-    def test_trace_generation(self):
+    def test_trace_generation(self, caplog):
         tracer = LangfuseTracer(tracer=MockTracer(), name="Haystack", public=False)
         tags = {
             "haystack.component.type": "OpenAIChatGenerator",
-            "haystack.component.output": {
-                "replies": [
-                    ChatMessage.from_assistant(
-                        "", meta={"completion_start_time": "2021-07-27T16:02:08.012345", "model": "test_model"}
-                    )
-                ]
-            },
+            "haystack.component.output": {"replies": [_MSG_OK]},
         }
-        with tracer.trace(operation_name="operation_name", tags=tags) as span:
-            ...
-        assert span.raw_span()._data["usage"] is None
-        assert span.raw_span()._data["model"] == "test_model"
-        assert span.raw_span()._data["completion_start_time"] == datetime.datetime(2021, 7, 27, 16, 2, 8, 12345)
+        with caplog.at_level(logging.WARNING):
+            with tracer.trace(operation_name="operation_name", tags=tags) as span:
+                ...
+        # errors raised while updating the span are only logged by the tracer
+        assert "Error during span cleanup" not in caplog.text
+        assert span.raw_span().usage is None
+        assert span.raw_span().model == "test_model"
+        assert span.raw_span().completion_start_time == datetime.datetime(2021, 7, 27, 16, 2, 8, 12345)
 
     def test_handle_tool_invoker(self):
         """
@@ -343,43 +413,128 @@ class TestLangfuseTracer:
         assert "search_tool (x2)" in updated_name, f"Expected 'search_tool (x2)' in {updated_name}"
         assert "weather_tool" in updated_name, f"Expected 'weather_tool' in {updated_name}"
 
-    def test_trace_generation_invalid_start_time(self):
+    def test_trace_generation_invalid_start_time(self, caplog):
         tracer = LangfuseTracer(tracer=MockTracer(), name="Haystack", public=False)
         tags = {
             "haystack.component.type": "OpenAIChatGenerator",
-            "haystack.component.output": {
-                "replies": [
-                    ChatMessage.from_assistant("", meta={"completion_start_time": "foobar", "model": "test_model"}),
-                ]
-            },
+            "haystack.component.output": {"replies": [_MSG_BAD]},
         }
-        with tracer.trace(operation_name="operation_name", tags=tags) as span:
-            ...
-        assert span.raw_span()._data["usage"] is None
-        assert span.raw_span()._data["model"] == "test_model"
-        assert span.raw_span()._data["completion_start_time"] is None
+        with caplog.at_level(logging.WARNING):
+            with tracer.trace(operation_name="operation_name", tags=tags) as span:
+                ...
+        # errors raised while updating the span are only logged by the tracer
+        assert "Error during span cleanup" not in caplog.text
+        assert span.raw_span().usage is None
+        assert span.raw_span().model == "test_model"
+        assert span.raw_span().completion_start_time is None
+
+    def test_no_flush_by_default(self, monkeypatch):
+        monkeypatch.delenv("HAYSTACK_LANGFUSE_ENFORCE_FLUSH", raising=False)
+        tracer_mock = CountingTracer()
 
-    def test_update_span_gets_flushed_by_default(self):
-        tracer_mock = Mock()
+        tracer = LangfuseTracer(tracer=tracer_mock, name="Haystack", public=False)
+        with tracer.trace(operation_name="operation_name", tags={"haystack.pipeline.input_data": "hello"}):
+            pass
+
+        tracer.shutdown()
+        assert tracer_mock.flushes == 0
+
+    def test_update_span_flush_enable(self, monkeypatch):
+        monkeypatch.setenv("HAYSTACK_LANGFUSE_ENFORCE_FLUSH", "true")
+        tracer_mock = CountingTracer()
 
         tracer = LangfuseTracer(tracer=tracer_mock, name="Haystack", public=False)
         with tracer.trace(operation_name="operation_name", tags={"haystack.pipeline.input_data": "hello"}) as span:
             pass
 
+        # flushing happens in the background, shutdown drains the pending flushes
+        tracer.shutdown()
+        assert tracer_mock.flushes == 1
+
+    def test_update_span_flushes_are_batched(self, monkeypatch):
+        monkeypatch.setenv("HAYSTACK_LANGFUSE_ENFORCE_FLUSH", "true")
+        tracer_mock = CountingTracer()
+
+        tracer = LangfuseTracer(tracer=tracer_mock, name="Haystack", public=False, flush_at=3, flush_interval=60)
+        for _ in range(3):
+            with tracer.trace(operation_name="operation_name", tags={"haystack.pipeline.input_data": "hello"}):
+                pass
+
+        tracer.shutdown()
+        assert tracer_mock.flushes == 1
+
+    def test_update_span_flushed_after_interval(self, monkeypatch):
+        monkeypatch.setenv("HAYSTACK_LANGFUSE_ENFORCE_FLUSH", "true")
+        tracer_mock = Mock()
+        flushed = threading.Event()
+        tracer_mock.flush.side_effect = flushed.set
+
+        tracer = LangfuseTracer(tracer=tracer_mock, name="Haystack", public=False, flush_at=100, flush_interval=0.01)
+        with tracer.trace(operation_name="operation_name", tags={"haystack.pipeline.input_data": "hello"}):
+            pass
+
+        assert flushed.wait(timeout=5)
+        tracer.shutdown()
         tracer_mock.flush.assert_called_once()
 
+    def test_flush_thread_stops_when_idle(self, monkeypatch):
+        monkeypatch.setenv("HAYSTACK_LANGFUSE_ENFORCE_FLUSH", "true")
+        tracer_mock = CountingTracer()
+
+        tracer = LangfuseTracer(tracer=tracer_mock, name="Haystack", public=False, flush_interval=0.01)
+        with tracer.trace(operation_name="operation_name", tags={"haystack.pipeline.input_data": "hello"}):
+            pass
+        flush_thread = tracer._flush_thread
+
+        flush_thread.join(timeout=5)
+        assert not flush_thread.is_alive()
+        assert tracer_mock.flushes == 1
+
+        # a new thread is started for the next span
+        with tracer.trace(operation_name="operation_name", tags={"haystack.pipeline.input_data": "hello"}):
+            pass
+        tracer.shutdown()
+        assert tracer_mock.flushes == 2
+
+    def test_dropped_tracer_is_garbage_collected(self, monkeypatch):
+        monkeypatch.setenv("HAYSTACK_LANGFUSE_ENFORCE_FLUSH", "true")
+
+        tracer = LangfuseTracer(tracer=CountingTracer(), name="Haystack", public=False, flush_interval=0.01)
+        with tracer.trace(operation_name="operation_name", tags={"haystack.pipeline.input_data": "hello"}):
+            pass
+        flush_thread = tracer._flush_thread
+        tracer_ref = weakref.ref(tracer)
+        del tracer
+
+        flush_thread.join(timeout=5)
+        assert not flush_thread.is_alive()
+        gc.collect()
+        assert tracer_ref() is None
+
     def test_update_span_flush_disable(self, monkeypatch):
         monkeypatch.setenv("HAYSTACK_LANGFUSE_ENFORCE_FLUSH", "false")
-        tracer_mock = Mock()
-
-        from haystack_integrations.tracing.langfuse.tracer import \
-            LangfuseTracer
+        tracer_mock = CountingTracer()
 
         tracer = LangfuseTracer(tracer=tracer_mock, name="Haystack", public=False)
         with tracer.trace(operation_name="operation_name", tags={"haystack.pipeline.input_data": "hello"}) as span:
             pass
 
-        tracer_mock.flush.assert_not_called()
+        assert tracer_mock.flushes == 0
+
+    def test_enforce_flush_is_read_at_init(self, monkeypatch):
+        monkeypatch.setenv("HAYSTACK_LANGFUSE_ENFORCE_FLUSH", "true")
+        tracer_mock = CountingTracer()
+
+        tracer = LangfuseTracer(tracer=tracer_mock, name="Haystack", public=False)
+        assert tracer.enforce_flush
+
+        # changing the environment variable after init doesn't affect the tracer
+        monkeypatch.setenv("HAYSTACK_LANGFUSE_ENFORCE_FLUSH", "false")
+        with tracer.trace(operation_name="operation_name", tags={"haystack.pipeline.input_data": "hello"}):
+            pass
+
+        tracer.shutdown()
+        assert tracer_mock.flushes == 1
 
     def test_context_is_empty_after_tracing(self):
         tracer_mock = Mock()
@@ -388,22 +543,65 @@ class TestLangfuseTracer:
         with tracer.trace(operation_name="operation_name", tags={"haystack.pipeline.input_data": "hello"}) as span:
             pass
 
-        assert tracer._context == []
+        assert len(tracer._context) == 0
 
-    def test_init_with_tracing_disabled(self, monkeypatch, caplog):
-        # Clear haystack modules because ProxyTracer is initialized whenever haystack is imported
-        modules_to_clear = [name for name in sys.modules if name.startswith('haystack')]
-        for name in modules_to_clear:
-            sys.modules.pop(name, None)
+    def test_span_is_handled_when_context_is_empty(self):
+        tracer = LangfuseTracer(tracer=MockTracer(), name="Haystack", public=False)
+        tags = {
+            "haystack.component.type": "OpenAIChatGenerator",
+            "haystack.component.output": {
+                "replies": [ChatMessage.from_assistant("", meta={"model": "test_model"})],
+            },
+        }
+        with tracer.trace(operation_name="operation_name", tags=tags) as span:
+            # e.g. the span is finished in a different context than the one it was started in
+            _span_stack_var.set(())
 
-        # Re-import LangfuseTracer and instantiate it with tracing disabled
-        with caplog.at_level(logging.WARNING):
-            monkeypatch.setenv("HAYSTACK_CONTENT_TRACING_ENABLED", "false")
-            from haystack_integrations.tracing.langfuse import LangfuseTracer
+        # an empty context must not short-circuit the span handling
+        assert span.raw_span().model == "test_model"
+        assert len(tracer._context) == 0
 
+    def test_context_is_isolated_between_tracers(self):
+        tracer = LangfuseTracer(tracer=MockTracer(), name="Haystack", public=False)
+        other_tracer = LangfuseTracer(tracer=MockTracer(), name="Haystack", public=False)
+        with tracer.trace(operation_name="operation_name") as span:
+            assert other_tracer.current_span() is None
+            with other_tracer.trace(operation_name="operation_name") as other_span:
+                assert tracer.current_span() == span
+                assert other_tracer.current_span() == other_span
+            assert len(other_tracer._context) == 0
+            assert len(tracer._context) == 1
+
+        assert _span_stack_var.get() == ()
+
+    def test_context_is_isolated_between_threads(self):
+        tracer = LangfuseTracer(tracer=MockTracer(), name="Haystack", public=False)
+        with tracer.trace(operation_name="operation_name") as span:
+            current_spans = []
+            thread = threading.Thread(target=lambda: current_spans.append(tracer.current_span()))
+            thread.start()
+            thread.join()
+
+            # spans opened in one thread don't become parents of spans created in another one
+            assert current_spans == [None]
+            assert tracer.current_span() == span
+
+        assert tracer.current_span() is None
+
+    def test_init_with_tracing_disabled(self, monkeypatch, caplog):
+        # ProxyTracer reads HAYSTACK_CONTENT_TRACING_ENABLED when haystack is imported, so we patch its flag
+        # directly instead of re-importing haystack
+        monkeypatch.setattr(proxy_tracer, "is_content_tracing_enabled", False)
+        with caplog.at_level(logging.WARNING):
             LangfuseTracer(tracer=MockTracer(), name="Haystack", public=False)
             assert "tracing is disabled" in caplog.text
 
+    def test_init_with_tracing_enabled(self, monkeypatch, caplog):
+        monkeypatch.setattr(proxy_tracer, "is_content_tracing_enabled", True)
+        with caplog.at_level(logging.WARNING):
+            LangfuseTracer(tracer=MockTracer(), name="Haystack", public=False)
+            assert "tracing is disabled" not in caplog.text
+
     def test_context_cleanup_after_nested_failures(self):
         """
         Test that tracer context is properly cleaned up even when nested operations fail.
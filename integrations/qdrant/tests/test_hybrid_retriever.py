@@ -1,5 +1,3 @@
-from unittest.mock import Mock
-
 import pytest
 from haystack.dataclasses import Document, SparseEmbedding
 from haystack.document_stores.types import FilterPolicy
@@ -9,10 +7,52 @@ from haystack_integrations.components.retrievers.qdrant import (
 )
 from haystack_integrations.document_stores.qdrant import QdrantDocumentStore
 
+# Shared, read-only test data
+_SPARSE = SparseEmbedding(indices=[0, 1, 2, 3], values=[0.1, 0.8, 0.05, 0.33])
+_DOC = Document(content="Test doc", embedding=[0.1, 0.2], sparse_embedding=_SPARSE)
+_QSPARSE = SparseEmbedding(indices=[0, 5], values=[0.1, 0.7])
+
+
+class _FakeStore(QdrantDocumentStore):
+    """
+    Returns canned documents from hybrid queries and records the called method with its arguments.
+
+    Subclasses QdrantDocumentStore to pass the retriever's isinstance check, without initializing a Qdrant client
+    or paying for the introspection of Mock(spec=QdrantDocumentStore).
+    """
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.calls = []
+
+    def _query_hybrid(self, **kwargs):
+        self.calls.append(("_query_hybrid", kwargs))
+        return self.documents
+
+    async def _query_hybrid_async(self, **kwargs):
+        self.calls.append(("_query_hybrid_async", kwargs))
+        return self.documents
+
+
+@pytest.fixture
+def fake_store():
+    return _FakeStore([_DOC])
+
+
+@pytest.fixture(scope="class")
+def document_store():
+    # The init and serialization tests don't write to the store, so they can share it
+    return QdrantDocumentStore(location=":memory:", index="test")
+
+
+@pytest.fixture(scope="class")
+def sparse_document_store():
+    return QdrantDocumentStore(location=":memory:", index="test", use_sparse_embeddings=True)
+
 
 class TestQdrantHybridRetriever:
-    def test_init_default(self):
-        document_store = QdrantDocumentStore(location=":memory:", index="test", use_sparse_embeddings=True)
+    def test_init_default(self, sparse_document_store):
+        document_store = sparse_document_store
         retriever = QdrantHybridRetriever(document_store=document_store)
 
         assert retriever._document_store == document_store
@@ -30,61 +70,24 @@ class TestQdrantHybridRetriever:
         with pytest.raises(ValueError):
             QdrantHybridRetriever(document_store=document_store, filter_policy="invalid")
 
-    def test_to_dict(self):
-        document_store = QdrantDocumentStore(location=":memory:", index="test")
+    def test_to_dict(self, document_store):
         retriever = QdrantHybridRetriever(document_store=document_store, top_k=5, return_embedding=True)
         res = retriever.to_dict()
-        assert res == {
-            "type": "haystack_integrations.components.retrievers.qdrant.retriever.QdrantHybridRetriever",
-            "init_parameters": {
-                "document_store": {
-                    "type": "haystack_integrations.document_stores.qdrant.document_store.QdrantDocumentStore",
-                    "init_parameters": {
-                        "location": ":memory:",
-                        "url": None,
-                        "port": 6333,
-                        "grpc_port": 6334,
-                        "prefer_grpc": False,
-                        "https": None,
-                        "api_key": None,
-                        "prefix": None,
-                        "timeout": None,
-                        "host": None,
-                        "path": None,
-                        "index": "test",
-                        "embedding_dim": 768,
-                        "on_disk": False,
-                        "force_disable_check_same_thread": False,
-                        "use_sparse_embeddings": False,
-                        "sparse_idf": False,
-                        "similarity": "cosine",
-                        "return_embedding": False,
-                        "progress_bar": True,
-                        "recreate_index": False,
-                        "shard_number": None,
-                        "replication_factor": None,
-                        "write_consistency_factor": None,
-                        "on_disk_payload": None,
-                        "hnsw_config": None,
-                        "optimizers_config": None,
-                        "wal_config": None,
-                        "quantization_config": None,
-                        "init_from": None,
-                        "wait_result_from_api": True,
-                        "metadata": {},
-                        "write_batch_size": 100,
-                        "scroll_size": 10000,
-                        "payload_fields_to_index": None,
-                    },
-                },
-                "filters": None,
-                "top_k": 5,
-                "filter_policy": "replace",
-                "return_embedding": True,
-                "score_threshold": None,
-                "group_by": None,
-                "group_size": None,
-            },
+        # Only check the fields owned by the retriever, the document store serialization is tested separately
+        assert res["type"] == "haystack_integrations.components.retrievers.qdrant.retriever.QdrantHybridRetriever"
+        assert res["init_parameters"]["document_store"]["type"] == (
+            "haystack_integrations.document_stores.qdrant.document_store.QdrantDocumentStore"
+        )
+        assert res["init_parameters"]["document_store"]["init_parameters"]["location"] == ":memory:"
+        assert res["init_parameters"]["document_store"]["init_parameters"]["index"] == "test"
+        assert {k: v for k, v in res["init_parameters"].items() if k != "document_store"} == {
+            "filters": None,
+            "top_k": 5,
+            "filter_policy": "replace",
+            "return_embedding": True,
+            "score_threshold": None,
+            "group_by": None,
+            "group_size": None,
         }
 
     def test_from_dict(self):
@@ -142,106 +145,33 @@ class TestQdrantHybridRetriever:
         assert retriever._group_by is None
         assert retriever._group_size is None
 
-    def test_run(self):
-        mock_store = Mock(spec=QdrantDocumentStore)
-        sparse_embedding = SparseEmbedding(indices=[0, 1, 2, 3], values=[0.1, 0.8, 0.05, 0.33])
-        mock_store._query_hybrid.return_value = [
-            Document(content="Test doc", embedding=[0.1, 0.2], sparse_embedding=sparse_embedding)
-        ]
-
-        retriever = QdrantHybridRetriever(document_store=mock_store)
-        res = retriever.run(
-            query_embedding=[0.5, 0.7], query_sparse_embedding=SparseEmbedding(indices=[0, 5], values=[0.1, 0.7])
-        )
-
-        call_args = mock_store._query_hybrid.call_args
-        assert call_args[1]["query_embedding"] == [0.5, 0.7]
-        assert call_args[1]["query_sparse_embedding"].indices == [0, 5]
-        assert call_args[1]["query_sparse_embedding"].values == [0.1, 0.7]
-        assert call_args[1]["top_k"] == 10
-        assert call_args[1]["return_embedding"] is False
-
-        assert res["documents"][0].content == "Test doc"
-        assert res["documents"][0].embedding == [0.1, 0.2]
-        assert res["documents"][0].sparse_embedding == sparse_embedding
-
-    def test_run_with_group_by(self):
-        mock_store = Mock(spec=QdrantDocumentStore)
-        sparse_embedding = SparseEmbedding(indices=[0, 1, 2, 3], values=[0.1, 0.8, 0.05, 0.33])
-        mock_store._query_hybrid.return_value = [
-            Document(content="Test doc", embedding=[0.1, 0.2], sparse_embedding=sparse_embedding)
-        ]
-
-        retriever = QdrantHybridRetriever(document_store=mock_store)
-        res = retriever.run(
-            query_embedding=[0.5, 0.7],
-            query_sparse_embedding=SparseEmbedding(indices=[0, 5], values=[0.1, 0.7]),
-            group_by="meta.group_field",
-            group_size=2,
-        )
-
-        call_args = mock_store._query_hybrid.call_args
-        assert call_args[1]["query_embedding"] == [0.5, 0.7]
-        assert call_args[1]["query_sparse_embedding"].indices == [0, 5]
-        assert call_args[1]["query_sparse_embedding"].values == [0.1, 0.7]
-        assert call_args[1]["top_k"] == 10
-        assert call_args[1]["return_embedding"] is False
-        assert call_args[1]["group_by"] == "meta.group_field"
-        assert call_args[1]["group_size"] == 2
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_async", [False, True], ids=["sync", "async"])
+    @pytest.mark.parametrize("group", [None, ("meta.group_field", 2)], ids=["no_group", "group_by"])
+    async def test_run(self, fake_store, use_async, group):
+        group_kwargs = {} if group is None else {"group_by": group[0], "group_size": group[1]}
+        retriever = QdrantHybridRetriever(document_store=fake_store)
+        query_kwargs = {
+            "query_embedding": [0.5, 0.7],
+            "query_sparse_embedding": _QSPARSE,
+            **group_kwargs,
+        }
+        if use_async:
+            res = await retriever.run_async(**query_kwargs)
+        else:
+            res = retriever.run(**query_kwargs)
+
+        assert len(fake_store.calls) == 1
+        method, call_kwargs = fake_store.calls[0]
+        assert method == ("_query_hybrid_async" if use_async else "_query_hybrid")
+        assert call_kwargs["query_embedding"] == [0.5, 0.7]
+        assert call_kwargs["query_sparse_embedding"].indices == [0, 5]
+        assert call_kwargs["query_sparse_embedding"].values == [0.1, 0.7]
+        assert call_kwargs["top_k"] == 10
+        assert call_kwargs["return_embedding"] is False
+        assert call_kwargs["group_by"] == group_kwargs.get("group_by")
+        assert call_kwargs["group_size"] == group_kwargs.get("group_size")
 
         assert res["documents"][0].content == "Test doc"
         assert res["documents"][0].embedding == [0.1, 0.2]
-        assert res["documents"][0].sparse_embedding == sparse_embedding
-
-    @pytest.mark.asyncio
-    async def test_run_async(self):
-        mock_store = Mock(spec=QdrantDocumentStore)
-        sparse_embedding = SparseEmbedding(indices=[0, 1, 2, 3], values=[0.1, 0.8, 0.05, 0.33])
-        mock_store._query_hybrid_async.return_value = [
-            Document(content="Test doc", embedding=[0.1, 0.2], sparse_embedding=sparse_embedding)
-        ]
-
-        retriever = QdrantHybridRetriever(document_store=mock_store)
-        result = await retriever.run_async(
-            query_embedding=[0.5, 0.7], query_sparse_embedding=SparseEmbedding(indices=[0, 5], values=[0.1, 0.7])
-        )
-
-        call_args = mock_store._query_hybrid_async.call_args
-        assert call_args[1]["query_embedding"] == [0.5, 0.7]
-        assert call_args[1]["query_sparse_embedding"].indices == [0, 5]
-        assert call_args[1]["query_sparse_embedding"].values == [0.1, 0.7]
-        assert call_args[1]["top_k"] == 10
-        assert call_args[1]["return_embedding"] is False
-
-        assert result["documents"][0].content == "Test doc"
-        assert result["documents"][0].embedding == [0.1, 0.2]
-        assert result["documents"][0].sparse_embedding == sparse_embedding
-
-    @pytest.mark.asyncio
-    async def test_run_with_group_by_async(self):
-        mock_store = Mock(spec=QdrantDocumentStore)
-        sparse_embedding = SparseEmbedding(indices=[0, 1, 2, 3], values=[0.1, 0.8, 0.05, 0.33])
-        mock_store._query_hybrid_async.return_value = [
-            Document(content="Test doc", embedding=[0.1, 0.2], sparse_embedding=sparse_embedding)
-        ]
-
-        retriever = QdrantHybridRetriever(document_store=mock_store)
-        result = await retriever.run_async(
-            query_embedding=[0.5, 0.7],
-            query_sparse_embedding=SparseEmbedding(indices=[0, 5], values=[0.1, 0.7]),
-            group_by="meta.group_field",
-            group_size=2,
-        )
-
-        call_args = mock_store._query_hybrid_async.call_args
-        assert call_args[1]["query_embedding"] == [0.5, 0.7]
-        assert call_args[1]["query_sparse_embedding"].indices == [0, 5]
-        assert call_args[1]["query_sparse_embedding"].values == [0.1, 0.7]
-        assert call_args[1]["top_k"] == 10
-        assert call_args[1]["return_embedding"] is False
-        assert call_args[1]["group_by"] == "meta.group_field"
-        assert call_args[1]["group_size"] == 2
-
-        assert result["documents"][0].content == "Test doc"
-        assert result["documents"][0].embedding == [0.1, 0.2]
-        assert result["documents"][0].sparse_embedding == sparse_embedding
+        assert res["documents"][0].sparse_embedding == _SPARSE